@@ -7,30 +7,34 @@ with different configurations and scenarios.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
 from pathlib import Path
+from typing import Optional
 
 # Import our modules
 from src.config_manager import ConfigManager
-from src.gmail_creator import GmailCreator
-from src.account_manager import AccountManager, AccountStatus
-from src.user_profile_generator import UserProfileGenerator
+from src.account_manager import AccountStatus
 from src.proxy_manager import ProxyManager
+from main import GmailCreatorApp
 
 
-async def example_basic_usage():
+@functools.lru_cache(maxsize=None)
+def get_app(config_file: Optional[str] = None) -> GmailCreatorApp:
+    """Build the application once per config file and share it across examples"""
+    return GmailCreatorApp(config_file)
+
+
+async def example_basic_usage(app: GmailCreatorApp):
     """Basic usage example - create 3 accounts with default settings"""
     print("=" * 60)
     print("EXAMPLE 1: Basic Usage")
     print("=" * 60)
     
-    # Initialize with default configuration
-    config_manager = ConfigManager()
-    logger = config_manager.setup_logging()
-    
-    # Create Gmail creator
-    creator = GmailCreator(config_manager)
+    # Reuse the Gmail creator built with the default configuration
+    creator = app.gmail_creator
     await creator.initialize()
     
     # Create 3 accounts
@@ -48,16 +52,23 @@ async def example_basic_usage():
         print(f"   📧 {account['email']} : {account['password']}")
 
 
+# Reserved documentation names (RFC 2606) that never resolve to a real proxy
+_PLACEHOLDER_SUFFIXES = (".example", ".example.com", ".example.net", ".example.org",
+                         ".test", ".invalid", ".localhost")
+
+
+def _is_placeholder_proxy(proxy: str) -> bool:
+    """Check whether a proxy string points at a reserved placeholder host"""
+    host = proxy.rsplit("@", 1)[-1].split("://", 1)[-1].split(":", 1)[0].lower()
+    return host in ("example.com", "example.net", "example.org") or host.endswith(_PLACEHOLDER_SUFFIXES)
+
+
 async def example_with_proxies():
     """Example using proxy configuration"""
     print("\n" + "=" * 60)
     print("EXAMPLE 2: Using Proxies")
     print("=" * 60)
     
-    # Load advanced configuration with proxies
-    config_manager = ConfigManager("config/advanced_config.yaml")
-    logger = config_manager.setup_logging()
-    
     # Test proxy connectivity first
     print("Testing proxy connectivity...")
     proxy_manager = ProxyManager()
@@ -68,7 +79,9 @@ async def example_with_proxies():
         "proxy2.example.com:3128",
     ]
     
-    if example_proxies:
+    if example_proxies and all(_is_placeholder_proxy(p) for p in example_proxies):
+        print("⚠️  Example proxies are placeholders - replace them with real ones to run this example")
+    elif example_proxies:
         proxy_manager.load_proxies_from_list(example_proxies)
         await proxy_manager.test_all_proxies()
         
@@ -76,8 +89,9 @@ async def example_with_proxies():
         print(f"Proxy Status: {stats['active']}/{stats['total']} active")
         
         if stats['active'] > 0:
-            # Create accounts with proxies
-            creator = GmailCreator(config_manager)
+            # Create accounts with proxies, using the advanced configuration
+            proxy_app = get_app("config/advanced_config.yaml")
+            creator = proxy_app.gmail_creator
             creator.proxy_manager = proxy_manager
             
             print("Creating 2 accounts with proxy rotation...")
@@ -94,14 +108,13 @@ async def example_with_proxies():
         print("⚠️  No proxies configured - skipping proxy example")
 
 
-async def example_account_management():
+async def example_account_management(app: GmailCreatorApp):
     """Example of account management features"""
     print("\n" + "=" * 60)
     print("EXAMPLE 3: Account Management")
     print("=" * 60)
     
-    config_manager = ConfigManager()
-    account_manager = AccountManager(config_manager)
+    account_manager = app.account_manager
     
     # Get statistics
     stats = account_manager.get_statistics()
@@ -126,14 +139,13 @@ async def example_account_management():
         print("ℹ️  No created accounts to export")
 
 
-def example_user_profiles():
+def example_user_profiles(app: GmailCreatorApp):
     """Example of user profile generation"""
     print("\n" + "=" * 60)
     print("EXAMPLE 4: User Profile Generation")
     print("=" * 60)
     
-    config_manager = ConfigManager()
-    generator = UserProfileGenerator(config_manager)
+    generator = app.user_generator
     
     # Generate 5 diverse profiles
     print("Generating 5 diverse user profiles...")
@@ -154,14 +166,13 @@ def example_user_profiles():
     print(f"\n✅ Profiles saved to example_profiles.json")
 
 
-async def example_batch_processing():
+async def example_batch_processing(app: GmailCreatorApp):
     """Example of batch processing with resume capability"""
     print("\n" + "=" * 60)
     print("EXAMPLE 5: Batch Processing")
     print("=" * 60)
     
-    config_manager = ConfigManager()
-    account_manager = AccountManager(config_manager)
+    account_manager = app.account_manager
     
     # Check if there's a batch to resume
     if account_manager.can_resume_batch():
@@ -200,10 +211,20 @@ def example_configuration():
         ("Advanced Config", "config/advanced_config.yaml")
     ]
     
+    # Configurations resolving to the same file are only loaded and validated once
+    seen = {}
+    
     for name, config_file in configs:
         try:
             print(f"\n{name}:")
             config_manager = ConfigManager(config_file)
+            
+            config_path = os.path.realpath(config_manager.config_file)
+            if config_path in seen:
+                print(f"  ↪ Same file as {seen[config_path]}, skipping")
+                continue
+            seen[config_path] = name
+            
             config = config_manager.load_config()
             
             # Validate configuration
@@ -227,12 +248,15 @@ async def main():
     print("=====================================")
     
     try:
+        # Build the shared application context once
+        app = get_app()
+        
         # Run examples
-        await example_basic_usage()
+        await example_basic_usage(app)
         await example_with_proxies() 
-        await example_account_management()
-        example_user_profiles()
-        await example_batch_processing()
+        await example_account_management(app)
+        example_user_profiles(app)
+        await example_batch_processing(app)
         example_configuration()
         
         print("\n" + "=" * 60)
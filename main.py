@@ -16,13 +16,59 @@ from datetime import datetime
 
 # Import our modules
 from src.config_manager import ConfigManager, LogLevel
-from src.gmail_creator import GmailCreator
-from src.account_manager import AccountManager, AccountStatus
+from src.account_manager import AccountManager, AccountStatus, STATUS_FROM_VALUE
 from src.user_profile_generator import UserProfileGenerator
-from src.proxy_manager import ProxyManager, FreeProxyFetcher
+
+# Optional imports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string, computed once per response"""
+    return datetime.now().isoformat()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a result to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize event fields to a single-line JSON string"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str).decode('utf-8')
+    return json.dumps(obj, default=str, separators=(',', ':'))
+
+
+def _write_summary(output_file: str, summary: Dict[str, Any], accounts: List[Any]) -> None:
+    """Write a batch summary to file, streaming accounts one at a time"""
+    with open(output_file, 'wb') as f:
+        f.write(b"{")
+        for key, value in summary.items():
+            f.write(_dumps_compact(key).encode('utf-8') + b":" + _dumps_compact(value).encode('utf-8') + b",")
+        
+        f.write(b'"accounts":[')
+        for index, account in enumerate(accounts):
+            if index:
+                f.write(b",\n")
+            f.write(_dumps_compact(account.to_dict()).encode('utf-8'))
+        f.write(b"]}\n")
+
+
+def _print_json(obj: Any) -> None:
+    """Write a result as indented JSON to stdout"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_dumps(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
 
 class GmailCreatorApp:
     """Main application class"""
@@ -39,18 +85,38 @@ class GmailCreatorApp:
         # Initialize components
         self.account_manager = AccountManager(self.config_manager)
         self.user_generator = UserProfileGenerator(self.config_manager)
-        self.gmail_creator = GmailCreator(self.config_manager)
+        self._gmail_creator = None
         
         self.logger.info("Gmail Creator Application initialized")
     
-    async def run_creation_batch(self, count: int, resume: bool = False) -> Dict[str, Any]:
-        """Run a batch of Gmail account creations"""
+    @property
+    def gmail_creator(self):
+        """Gmail creator, built on first use so non-browser commands skip importing Playwright"""
+        if self._gmail_creator is None:
+            from src.gmail_creator import GmailCreator
+            self._gmail_creator = GmailCreator(self.config_manager)
+        return self._gmail_creator
+    
+    def _emit(self, event: str, **fields) -> None:
+        """Log a structured event; fields are only serialized when INFO is enabled"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("%s %s", event, _dumps_compact(fields))
+    
+    async def run_creation_batch(self, count: int, resume: bool = False,
+                                 output_file: Optional[str] = None) -> Dict[str, Any]:
+        """Run a batch of Gmail account creations
+        
+        When output_file is given, the full summary is streamed there and the
+        returned summary omits the per-account list.
+        """
         try:
             # Check for resume capability
+            resumed = False
             if resume and self.account_manager.can_resume_batch():
                 batch_info = self.account_manager.get_batch_resume_info()
-                self.logger.info(f"Resuming batch: {batch_info}")
+                self._emit("gmail.batch.resume", **batch_info)
                 self.account_manager.resume_batch()
+                resumed = True
                 # Adjust count based on already completed accounts
                 remaining = batch_info['total_accounts'] - batch_info['completed_accounts']
                 count = min(count, remaining)
@@ -62,15 +128,15 @@ class GmailCreatorApp:
             # Initialize Gmail creator
             await self.gmail_creator.initialize()
             
-            # Start batch tracking
-            if not resume:
+            # Start batch tracking unless an interrupted batch was resumed
+            if not resumed:
                 batch_id = self.account_manager.start_batch(
                     count, 
                     f"Automated batch creation of {count} accounts"
                 )
             
             # Create accounts
-            self.logger.info(f"Starting creation of {count} Gmail accounts")
+            self._emit("gmail.batch.start", count=count)
             results = await self.gmail_creator.create_bulk_accounts(count)
             
             # Process results and update account manager
@@ -80,32 +146,20 @@ class GmailCreatorApp:
             for i, result in enumerate(results):
                 try:
                     if result.get('status') == 'created':
-                        # Create account object from result
-                        profile = self.user_generator.generate_profile()  # This should be the actual profile used
-                        account = self.account_manager.create_account_from_profile(
-                            profile,
-                            proxy_used=result.get('proxy_used'),
-                            user_agent=result.get('user_agent'),
-                            status=AccountStatus.CREATED
-                        )
-                        
-                        # Override with actual data from result
-                        account.email = result['email']
-                        account.password = result['password']
-                        account.first_name = result['first_name']
-                        account.last_name = result['last_name']
-                        
-                        self.account_manager.add_account(account)
-                        successful_accounts.append(account)
+                        successful_accounts.append(self._account_from_result(result))
                         
                     else:
                         # Handle failed account
                         failed_accounts.append(result)
                         
                 except Exception as e:
-                    self.logger.error(f"Error processing result {i}: {e}")
+                    self.logger.error("Error processing result %d: %s", i, e)
                     failed_accounts.append({"error": str(e), "index": i})
             
+            # Persist all successful accounts in a single write, off the event loop
+            if not await self.account_manager.add_accounts_async(successful_accounts):
+                self.logger.error("Failed to save %d created accounts", len(successful_accounts))
+            
             # Update batch progress
             self.account_manager.update_batch_progress(len(successful_accounts), len(failed_accounts))
             
@@ -123,22 +177,46 @@ class GmailCreatorApp:
                 "successful_accounts": len(successful_accounts),
                 "failed_accounts": len(failed_accounts),
                 "success_rate": (len(successful_accounts) / count * 100) if count > 0 else 0,
-                "accounts": [acc.to_dict() for acc in successful_accounts],
                 "failures": failed_accounts,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             
-            self.logger.info(f"Batch creation completed: {len(successful_accounts)}/{count} successful")
+            if output_file:
+                _write_summary(output_file, summary, successful_accounts)
+                summary["output_file"] = output_file
+            else:
+                summary["accounts"] = [acc.to_dict() for acc in successful_accounts]
+            
+            self._emit(
+                "gmail.batch.completed",
+                successful=len(successful_accounts),
+                failed=len(failed_accounts),
+                requested=count
+            )
             return summary
             
         except Exception as e:
-            self.logger.error(f"Error in batch creation: {e}")
+            self.logger.error("Error in batch creation: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
     
+    def _account_from_result(self, result: Dict[str, Any]):
+        """Build an account object from a successful creation result"""
+        # Create account object from the profile used during creation
+        account = self.account_manager.create_account_from_profile(
+            result['profile'],
+            proxy_used=result.get('proxy_used'),
+            user_agent=result.get('user_agent')
+        )
+        account.status = AccountStatus.CREATED
+        
+        # The chosen username may be a variation of the profile's
+        account.email = result['email']
+        return account
+    
     async def test_proxies(self) -> Dict[str, Any]:
         """Test proxy connectivity"""
         try:
@@ -147,6 +225,8 @@ class GmailCreatorApp:
             if not self.config.proxy.enabled:
                 return {"status": "skipped", "message": "Proxy not enabled"}
             
+            from src.proxy_manager import ProxyManager, FreeProxyFetcher
+            
             # Initialize proxy manager
             proxy_manager = ProxyManager()
             
@@ -163,15 +243,15 @@ class GmailCreatorApp:
             
             stats = proxy_manager.get_proxy_stats()
             
-            self.logger.info(f"Proxy test completed: {stats['active']}/{stats['total']} proxies active")
+            self._emit("proxy.test.completed", active=stats['active'], total=stats['total'])
             return {
                 "status": "completed",
                 "proxy_stats": stats,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             
         except Exception as e:
-            self.logger.error(f"Error testing proxies: {e}")
+            self.logger.error("Error testing proxies: %s", e)
             return {"status": "error", "error": str(e)}
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -183,11 +263,12 @@ class GmailCreatorApp:
             return {
                 "account_statistics": account_stats,
                 "configuration": config_summary,
-                "timestamp": datetime.now().isoformat()
+                # Same instant the account statistics were computed
+                "timestamp": account_stats.get("last_updated") or _now_iso()
             }
             
         except Exception as e:
-            self.logger.error(f"Error getting statistics: {e}")
+            self.logger.error("Error getting statistics: %s", e)
             return {"status": "error", "error": str(e)}
     
     def export_accounts(self, output_file: str, format_type: str = "json", status_filter: str = None) -> Dict[str, Any]:
@@ -195,9 +276,8 @@ class GmailCreatorApp:
         try:
             status_enum = None
             if status_filter:
-                try:
-                    status_enum = AccountStatus(status_filter.lower())
-                except ValueError:
+                status_enum = STATUS_FROM_VALUE.get(status_filter.lower())
+                if status_enum is None:
                     return {"status": "error", "error": f"Invalid status filter: {status_filter}"}
             
             success = self.account_manager.export_accounts(output_file, format_type, status_enum)
@@ -206,36 +286,36 @@ class GmailCreatorApp:
                 return {
                     "status": "success",
                     "message": f"Accounts exported to {output_file}",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 }
             else:
                 return {"status": "error", "error": "Export failed"}
                 
         except Exception as e:
-            self.logger.error(f"Error exporting accounts: {e}")
+            self.logger.error("Error exporting accounts: %s", e)
             return {"status": "error", "error": str(e)}
     
     def validate_configuration(self) -> Dict[str, Any]:
         """Validate current configuration"""
         try:
-            errors = self.config_manager.validate_config()
+            errors, summary = self.config_manager.validate_and_summarize()
             
             if errors:
                 return {
                     "status": "invalid",
                     "errors": errors,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 }
             else:
                 return {
                     "status": "valid",
                     "message": "Configuration is valid",
-                    "summary": self.config_manager.get_config_summary(),
-                    "timestamp": datetime.now().isoformat()
+                    "summary": summary,
+                    "timestamp": _now_iso()
                 }
                 
         except Exception as e:
-            self.logger.error(f"Error validating configuration: {e}")
+            self.logger.error("Error validating configuration: %s", e)
             return {"status": "error", "error": str(e)}
 
 
@@ -308,30 +388,31 @@ async def main():
         
         # Execute command
         if args.command == "create":
-            result = await app.run_creation_batch(args.count, args.resume)
+            result = await app.run_creation_batch(args.count, args.resume, args.output)
             
-            if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(result, f, indent=2)
+            if args.output and result.get("output_file"):
+                print(f"Results saved to {args.output}")
+            elif args.output:
+                Path(args.output).write_bytes(_dumps(result))
                 print(f"Results saved to {args.output}")
             else:
-                print(json.dumps(result, indent=2))
+                _print_json(result)
         
         elif args.command == "test-proxies":
             result = await app.test_proxies()
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         
         elif args.command == "stats":
             result = app.get_statistics()
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         
         elif args.command == "export":
             result = app.export_accounts(args.output_file, args.format, args.status)
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         
         elif args.command == "validate":
             result = app.validate_configuration()
-            print(json.dumps(result, indent=2))
+            _print_json(result)
             
             if result["status"] != "valid":
                 sys.exit(1)
@@ -342,7 +423,7 @@ async def main():
     
     except Exception as e:
         print(f"Fatal error: {e}")
-        logging.getLogger().error(f"Fatal error: {e}", exc_info=True)
+        logging.getLogger().error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -7,9 +7,9 @@ This script helps set up the environment and verify the installation.
 
 import os
 import sys
+import argparse
 import subprocess
 import platform
-from pathlib import Path
 
 
 def print_banner():
@@ -46,13 +46,15 @@ def check_pip():
         return False
 
 
-def install_requirements():
+def install_requirements(force=False):
     """Install required packages"""
     print("\n📦 Installing requirements...")
+    command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+    if force:
+        command.append("--force-reinstall")
+    
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ])
+        subprocess.check_call(command)
         print("✅ Requirements installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -60,13 +62,16 @@ def install_requirements():
         return False
 
 
-def install_playwright_browsers():
+def install_playwright_browsers(force=False):
     """Install Playwright browsers"""
     print("\n🌐 Installing Playwright browsers...")
+    # playwright install is already a no-op for browsers that are up to date
+    command = [sys.executable, "-m", "playwright", "install", "chromium"]
+    if force:
+        command.append("--force")
+    
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "playwright", "install", "chromium"
-        ])
+        subprocess.check_call(command)
         print("✅ Playwright browsers installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -78,9 +83,13 @@ def create_directories():
     """Create necessary directories"""
     print("\n📁 Creating directories...")
     directories = ["logs", "output", "data", "config"]
+    existing = {entry.name for entry in os.scandir(".") if entry.is_dir()}
     
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+        if directory in existing:
+            print(f"   Exists: {directory}/")
+            continue
+        os.makedirs(directory, exist_ok=True)
         print(f"   Created: {directory}/")
     
     print("✅ Directories created successfully")
@@ -147,8 +156,17 @@ def show_next_steps():
     """)
 
 
+def parse_args():
+    """Parse setup command line options"""
+    parser = argparse.ArgumentParser(description="Set up the Gmail Creator environment")
+    parser.add_argument("--force-reinstall", action="store_true",
+                        help="Reinstall requirements and browsers even if already present")
+    return parser.parse_args()
+
+
 def main():
     """Main setup function"""
+    args = parse_args()
     print_banner()
     
     # Check system requirements
@@ -159,10 +177,10 @@ def main():
         sys.exit(1)
     
     # Install dependencies
-    if not install_requirements():
+    if not install_requirements(args.force_reinstall):
         sys.exit(1)
     
-    if not install_playwright_browsers():
+    if not install_playwright_browsers(args.force_reinstall):
         sys.exit(1)
     
     # Setup directories
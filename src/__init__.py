@@ -9,12 +9,18 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .config_manager import ConfigManager
-from .gmail_creator import GmailCreator
-from .account_manager import AccountManager
-from .user_profile_generator import UserProfileGenerator
-from .proxy_manager import ProxyManager
-from .stealth_manager import StealthManager
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# commands not driving a browser never import Playwright or aiohttp
+_LAZY = {
+    "ConfigManager": ".config_manager",
+    "GmailCreator": ".gmail_creator",
+    "AccountManager": ".account_manager",
+    "UserProfileGenerator": ".user_profile_generator",
+    "ProxyManager": ".proxy_manager",
+    "StealthManager": ".stealth_manager",
+}
 
 __all__ = [
     "ConfigManager",
@@ -23,4 +29,17 @@ __all__ = [
     "UserProfileGenerator",
     "ProxyManager",
     "StealthManager"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -0,0 +1,162 @@
+"""
+Parsed File Cache
+
+Process-wide cache of parsed configuration files keyed by path and
+modification time, so repeated ConfigManager instances do not re-read
+and re-parse the same YAML/JSON file. YAML files also get a JSON sidecar
+that carries the parse across process restarts.
+"""
+
+import functools
+import importlib.util
+import json
+import mmap
+import os
+from typing import Dict, Any, Optional, Tuple
+
+# Optional imports
+# PyYAML is only imported once a YAML file actually has to be parsed or written
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Set GMAIL_CREATOR_SKIP_CONFIG_STAT=1 to trust the first parse of a file
+# for the lifetime of the process and skip the os.stat call entirely.
+SKIP_STAT = os.environ.get("GMAIL_CREATOR_SKIP_CONFIG_STAT") == "1"
+
+# Files larger than this are read through mmap rather than copied into a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def yaml_module():
+    """Import PyYAML on first use"""
+    import yaml
+    return yaml
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    """Parse a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        # orjson parses large files straight from the page cache
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+# Parsed YAML is mirrored to "<file>.jsoncache" so later processes can skip
+# the (much slower) YAML parse until the source file is edited again. The
+# sidecar records the source's (mtime_ns, size) and is only used on an exact
+# match, so restored or back-dated files are re-parsed too.
+SIDECAR_SUFFIX = ".jsoncache"
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_native(value: Any) -> bool:
+    """True if value survives a JSON round trip with the same types"""
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_native(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(_is_json_native(v) for v in value)
+    return isinstance(value, _JSON_SCALARS)
+
+
+def _read_sidecar(path: str, signature: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """Return the JSON sidecar's data if it was written for this exact source"""
+    try:
+        cached = _load_json(path + SIDECAR_SUFFIX)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("source") != list(signature):
+        return None
+    return cached.get("data")
+
+
+def _write_sidecar(path: str, signature: Tuple[int, int], data: Dict[str, Any]) -> None:
+    """Atomically write the JSON sidecar; failures only cost the next parse"""
+    # Dates, sets and non-string keys would come back as different types
+    if not _is_json_native(data):
+        return
+    
+    payload = {"source": list(signature), "data": data}
+    sidecar = path + SIDECAR_SUFFIX
+    tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode('utf-8'))
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _parse_file(path: str, signature: Tuple[int, int]) -> Dict[str, Any]:
+    """Read and parse a JSON or YAML file"""
+    if path.endswith('.json'):
+        return _load_json(path)
+    
+    data = _read_sidecar(path, signature)
+    if data is not None:
+        return data
+    
+    if not YAML_AVAILABLE:
+        raise ImportError("YAML support not available - please install pyyaml or use JSON config")
+    yaml = yaml_module()
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = yaml.load(mm, Loader=loader) or {}
+        else:
+            data = yaml.load(f, Loader=loader) or {}
+    
+    _write_sidecar(path, signature, data)
+    return data
+
+
+def get_parsed(path: str) -> Dict[str, Any]:
+    """Return the parsed contents of a config file, re-parsing only when it changed.
+
+    The returned dict is shared; callers must not mutate it.
+    """
+    key = os.path.abspath(path)
+
+    if SKIP_STAT and key in _cache:
+        return _cache[key][1]
+
+    st = os.stat(key)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = _parse_file(key, signature)
+    _cache[key] = (signature, data)
+    return data
+
+
+def invalidate(path: str = None) -> None:
+    """Drop one cached file and its sidecar, or the whole in-memory cache"""
+    if path is None:
+        _cache.clear()
+        return
+    
+    key = os.path.abspath(path)
+    _cache.pop(key, None)
+    try:
+        os.remove(key + SIDECAR_SUFFIX)
+    except OSError:
+        pass
@@ -10,18 +10,50 @@ import csv
 import sqlite3
 import logging
 import asyncio
+import atexit
+import functools
+import threading
+import weakref
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from enum import Enum
+import os
+import time
 import uuid
+from collections import OrderedDict
 
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, DATACLASS_SLOTS
 from .user_profile_generator import UserProfile
 
+# Optional imports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+    parse_datetime = datetime.fromisoformat
+
 logger = logging.getLogger(__name__)
 
+# Full account objects kept in memory; others are loaded from SQLite on demand
+ACCOUNT_CACHE_SIZE = 4096
+
+# Running batches whose checkpoint is older than this are not auto-resumed
+BATCH_STATE_MAX_AGE = timedelta(hours=24)
+
+# Progress checkpoints are rewritten at most this often, or every N accounts
+BATCH_STATE_FLUSH_INTERVAL = 1.0
+BATCH_STATE_FLUSH_EVERY = 50
+
 
 class AccountStatus(Enum):
     PENDING = "pending"
@@ -41,7 +73,12 @@ class VerificationStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Flat value-to-member lookups, cheaper than calling the Enum per row
+STATUS_FROM_VALUE: Dict[str, AccountStatus] = {status.value: status for status in AccountStatus}
+VERIFICATION_FROM_VALUE: Dict[str, VerificationStatus] = {status.value: status for status in VerificationStatus}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GmailAccount:
     """Gmail account data structure"""
     id: str
@@ -68,32 +105,151 @@ class GmailAccount:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert account to dictionary"""
-        data = asdict(self)
-        # Convert enums to strings
-        data['status'] = self.status.value
-        data['verification_status'] = self.verification_status.value
-        # Convert datetime objects to ISO strings
-        data['created_at'] = self.created_at.isoformat() if self.created_at else None
-        data['last_updated'] = self.last_updated.isoformat() if self.last_updated else None
-        data['last_login'] = self.last_login.isoformat() if self.last_login else None
-        return data
+        # Fields are all scalars, so build the dict directly rather than via asdict()
+        return {
+            "id": self.id,
+            "email": self.email,
+            "password": self.password,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "birth_date": self.birth_date,
+            "gender": self.gender,
+            "status": self.status.value,
+            "verification_status": self.verification_status.value,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+            "proxy_used": self.proxy_used,
+            "user_agent": self.user_agent,
+            "recovery_email": self.recovery_email,
+            "phone_number": self.phone_number,
+            "country": self.country,
+            "city": self.city,
+            "locale": self.locale,
+            "notes": self.notes,
+            "login_attempts": self.login_attempts,
+            "last_login": self.last_login.isoformat() if self.last_login else None
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GmailAccount':
         """Create account from dictionary"""
         # Convert string enums back to enum objects
-        data['status'] = AccountStatus(data['status'])
-        data['verification_status'] = VerificationStatus(data['verification_status'])
+        data['status'] = STATUS_FROM_VALUE[data['status']]
+        data['verification_status'] = VERIFICATION_FROM_VALUE[data['verification_status']]
         
         # Convert ISO strings back to datetime objects
         if data.get('created_at'):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
+            data['created_at'] = parse_datetime(data['created_at'])
         if data.get('last_updated'):
-            data['last_updated'] = datetime.fromisoformat(data['last_updated'])
+            data['last_updated'] = parse_datetime(data['last_updated'])
         if data.get('last_login'):
-            data['last_login'] = datetime.fromisoformat(data['last_login'])
+            data['last_login'] = parse_datetime(data['last_login'])
         
         return cls(**data)
+    
+    @classmethod
+    def from_row(cls, row: Tuple[Any, ...]) -> 'GmailAccount':
+        """Create account from a database row in ACCOUNT_COLUMNS order"""
+        return cls(
+            id=row[0],
+            email=row[1],
+            password=row[2],
+            first_name=row[3],
+            last_name=row[4],
+            birth_date=row[5],
+            gender=row[6],
+            status=STATUS_FROM_VALUE[row[7]],
+            verification_status=VERIFICATION_FROM_VALUE[row[8]],
+            created_at=parse_datetime(row[9]) if row[9] else None,
+            last_updated=parse_datetime(row[10]) if row[10] else None,
+            proxy_used=row[11],
+            user_agent=row[12],
+            recovery_email=row[13],
+            phone_number=row[14],
+            country=row[15],
+            city=row[16],
+            locale=row[17],
+            notes=row[18],
+            login_attempts=row[19],
+            last_login=parse_datetime(row[20]) if row[20] else None
+        )
+    
+    def to_row(self) -> Tuple[Any, ...]:
+        """Convert account to a row tuple in ACCOUNT_COLUMNS order"""
+        return (
+            self.id,
+            self.email,
+            self.password,
+            self.first_name,
+            self.last_name,
+            self.birth_date,
+            self.gender,
+            self.status.value,
+            self.verification_status.value,
+            self.created_at.isoformat() if self.created_at else None,
+            self.last_updated.isoformat() if self.last_updated else None,
+            self.proxy_used,
+            self.user_agent,
+            self.recovery_email,
+            self.phone_number,
+            self.country,
+            self.city,
+            self.locale,
+            self.notes,
+            self.login_attempts,
+            self.last_login.isoformat() if self.last_login else None
+        )
+
+
+# Column order of the accounts table, matching GmailAccount field order
+ACCOUNT_COLUMNS = tuple(f.name for f in fields(GmailAccount))
+
+INSERT_ACCOUNT_SQL = (
+    f"INSERT OR REPLACE INTO accounts ({','.join(ACCOUNT_COLUMNS)}) "
+    f"VALUES ({','.join('?' * len(ACCOUNT_COLUMNS))})"
+)
+
+ACCOUNT_COLUMN_SET = frozenset(ACCOUNT_COLUMNS)
+
+LINK_ACCOUNT_BATCH_SQL = "INSERT OR IGNORE INTO account_batches (account_id, batch_id) VALUES (?, ?)"
+
+SELECT_ACCOUNTS_SQL = f"SELECT {','.join(ACCOUNT_COLUMNS)} FROM accounts"
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _to_column_value(value: Any) -> Any:
+    """Convert a field value to its stored column representation"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+# Managers whose connections are closed at exit; weak so finished managers can be collected
+_OPEN_MANAGERS: "weakref.WeakSet[AccountManager]" = weakref.WeakSet()
+
+
+def _close_open_managers() -> None:
+    """Close the database connections of every manager still alive at exit"""
+    for manager in list(_OPEN_MANAGERS):
+        manager.close()
+
+
+atexit.register(_close_open_managers)
 
 
 class AccountManager:
@@ -107,12 +263,21 @@ class AccountManager:
         self.db_path = Path(self.config.project_root) / self.config.data_dir / "accounts.db"
         self.db_path.parent.mkdir(exist_ok=True)
         
-        # In-memory account cache
-        self.accounts: Dict[str, GmailAccount] = {}
+        # Bounded in-memory account cache, least recently used first
+        self.accounts: "OrderedDict[str, GmailAccount]" = OrderedDict()
         
         # Batch processing state
         self.current_batch_id: Optional[str] = None
         self.batch_state_file = Path(self.config.project_root) / self.config.data_dir / "batch_state.json"
+        self.batch_state_backup = self.batch_state_file.with_name(self.batch_state_file.name + ".bak")
+        self._batch_state: Optional[Dict[str, Any]] = None
+        self._last_flush_ts = 0.0
+        
+        # One SQLite connection per thread, all closed together in close()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        _OPEN_MANAGERS.add(self)
         
         # Initialize database
         self._init_database()
@@ -123,7 +288,8 @@ class AccountManager:
     def _init_database(self):
         """Initialize SQLite database"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self.conn
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             # Create accounts table
@@ -179,8 +345,18 @@ class AccountManager:
                 )
             """)
             
+            # Indexes for status filters and aggregates
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_accounts_status ON accounts(status)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_accounts_verification_status ON accounts(verification_status)"
+            )
+            # email TEXT UNIQUE already has an autoindex; drop the duplicate older databases created
+            cursor.execute("DROP INDEX IF EXISTS idx_accounts_email")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ab_batch ON account_batches(batch_id)")
+            # Lets cleanup_old_batches range-scan completed batches by start time
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_batch_logs_start ON batch_logs(status, start_time)")
+            
             conn.commit()
-            conn.close()
             
             logger.info("Database initialized successfully")
             
@@ -188,122 +364,197 @@ class AccountManager:
             logger.error(f"Failed to initialize database: {e}")
             raise
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # close() may run on another thread, hence check_same_thread=False
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            # Serve reads of larger databases from the page cache via mmap
+            conn.execute("PRAGMA mmap_size=268435456")
+            # Let SQLite retry on a locked database instead of failing immediately
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
     def _load_accounts_from_db(self):
-        """Load all accounts from database into memory"""
+        """Report the stored accounts; records are loaded on demand"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM accounts")
-            rows = cursor.fetchall()
-            
-            # Get column names
-            columns = [description[0] for description in cursor.description]
-            
-            for row in rows:
-                account_data = dict(zip(columns, row))
-                account = GmailAccount.from_dict(account_data)
-                self.accounts[account.id] = account
-            
-            conn.close()
-            
-            logger.info(f"Loaded {len(self.accounts)} accounts from database")
+            count = self.conn.execute("SELECT COUNT(*) FROM accounts").fetchone()[0]
+            logger.info(f"Found {count} accounts in database")
             
         except Exception as e:
             logger.error(f"Failed to load accounts from database: {e}")
     
+    def _cache_account(self, account: GmailAccount):
+        """Add account to the in-memory cache"""
+        self.accounts[account.id] = account
+        self.accounts.move_to_end(account.id)
+        if len(self.accounts) > ACCOUNT_CACHE_SIZE:
+            self.accounts.popitem(last=False)
+    
+    def _iter_accounts(self, where: str = "", params: Tuple[Any, ...] = ()):
+        """Stream accounts from the database, preferring cached instances"""
+        cursor = self.conn.cursor()
+        cursor.arraysize = 1000
+        
+        # Columns are selected in ACCOUNT_COLUMNS order for positional construction
+        cursor.execute(f"{SELECT_ACCOUNTS_SQL} {where}", params)
+        
+        rows = cursor.fetchmany()
+        while rows:
+            for row in rows:
+                yield self.accounts.get(row[0]) or GmailAccount.from_row(row)
+            rows = cursor.fetchmany()
+    
     def add_account(self, account: GmailAccount) -> bool:
         """Add account to manager and database"""
+        conn = self.conn
         try:
-            # Add to memory cache
-            self.accounts[account.id] = account
-            
-            # Add to database
-            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
-            account_data = account.to_dict()
-            columns = list(account_data.keys())
-            placeholders = ['?' for _ in columns]
-            values = list(account_data.values())
-            
-            cursor.execute(
-                f"INSERT OR REPLACE INTO accounts ({','.join(columns)}) VALUES ({','.join(placeholders)})",
-                values
-            )
+            cursor.execute(INSERT_ACCOUNT_SQL, account.to_row())
+            if self.current_batch_id:
+                cursor.execute(LINK_ACCOUNT_BATCH_SQL, (account.id, self.current_batch_id))
             
             conn.commit()
-            conn.close()
-            
-            logger.debug(f"Added account {account.email} to database")
-            return True
             
-        except Exception as e:
-            logger.error(f"Failed to add account {account.email}: {e}")
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error("Failed to add account %s: %s", account.email, e)
             return False
+        
+        # Cache only what was actually persisted
+        self._cache_account(account)
+        
+        logger.debug("Added account %s to database", account.email)
+        return True
     
-    def update_account(self, account_id: str, **kwargs) -> bool:
-        """Update account information"""
+    def add_accounts(self, accounts: List[GmailAccount]) -> bool:
+        """Add several accounts to manager and database in one transaction"""
+        if not accounts:
+            return True
+        
+        conn = self.conn
         try:
-            if account_id not in self.accounts:
-                logger.warning(f"Account {account_id} not found")
-                return False
-            
-            account = self.accounts[account_id]
-            
-            # Update fields
-            for key, value in kwargs.items():
-                if hasattr(account, key):
-                    setattr(account, key, value)
+            cursor = conn.cursor()
             
-            # Update timestamp
-            account.last_updated = datetime.now()
+            cursor.executemany(INSERT_ACCOUNT_SQL, [account.to_row() for account in accounts])
             
-            # Update in database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # Link to the running batch in the same transaction
+            if self.current_batch_id:
+                cursor.executemany(
+                    LINK_ACCOUNT_BATCH_SQL,
+                    [(account.id, self.current_batch_id) for account in accounts]
+                )
             
-            account_data = account.to_dict()
-            set_clause = ', '.join([f"{key} = ?" for key in account_data.keys()])
-            values = list(account_data.values()) + [account_id]
+            conn.commit()
             
-            cursor.execute(
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error("Failed to add %d accounts: %s", len(accounts), e)
+            return False
+        
+        # Cache only what was actually persisted
+        for account in accounts:
+            self._cache_account(account)
+        
+        logger.debug("Added %d accounts to database", len(accounts))
+        return True
+    
+    def update_account(self, account_id: str, **kwargs) -> bool:
+        """Update account information"""
+        account = self.get_account(account_id)
+        if account is None:
+            logger.warning("Account %s not found", account_id)
+            return False
+        
+        # Collect only the columns that were passed; the object is updated after the commit
+        updates = {key: value for key, value in kwargs.items() if hasattr(account, key)}
+        changes = {key: _to_column_value(value) for key, value in updates.items() if key in ACCOUNT_COLUMN_SET}
+        
+        last_updated = datetime.now()
+        changes["last_updated"] = last_updated.isoformat()
+        
+        # Update in database
+        conn = self.conn
+        try:
+            set_clause = ', '.join(f"{column} = ?" for column in changes)
+            conn.execute(
                 f"UPDATE accounts SET {set_clause} WHERE id = ?",
-                values
+                tuple(changes.values()) + (account_id,)
             )
-            
             conn.commit()
-            conn.close()
-            
-            logger.debug(f"Updated account {account.email}")
-            return True
             
-        except Exception as e:
-            logger.error(f"Failed to update account {account_id}: {e}")
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error("Failed to update account %s: %s", account_id, e)
             return False
+        
+        for key, value in updates.items():
+            setattr(account, key, value)
+        account.last_updated = last_updated
+        self._cache_account(account)
+        
+        logger.debug("Updated account %s", account.email)
+        return True
+    
+    # Async variants run the blocking SQLite work in a worker thread; use these
+    # instead of the sync methods when calling from the event loop.
+    # run_in_executor rather than asyncio.to_thread, which needs Python 3.9+
+    
+    async def add_account_async(self, account: GmailAccount) -> bool:
+        """Add account without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.add_account, account)
+    
+    async def add_accounts_async(self, accounts: List[GmailAccount]) -> bool:
+        """Add several accounts without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.add_accounts, accounts)
+    
+    async def update_account_async(self, account_id: str, **kwargs) -> bool:
+        """Update account information without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.update_account, account_id, **kwargs))
     
     def get_account(self, account_id: str) -> Optional[GmailAccount]:
         """Get account by ID"""
-        return self.accounts.get(account_id)
+        account = self.accounts.get(account_id)
+        if account is not None:
+            self.accounts.move_to_end(account_id)
+            return account
+        
+        account = next(self._iter_accounts("WHERE id = ?", (account_id,)), None)
+        if account is not None:
+            self._cache_account(account)
+        return account
     
     def get_account_by_email(self, email: str) -> Optional[GmailAccount]:
         """Get account by email address"""
-        for account in self.accounts.values():
-            if account.email == email:
-                return account
-        return None
+        account = next(self._iter_accounts("WHERE email = ?", (email,)), None)
+        if account is not None:
+            self._cache_account(account)
+        return account
     
     def get_accounts_by_status(self, status: AccountStatus) -> List[GmailAccount]:
         """Get all accounts with specific status"""
-        return [account for account in self.accounts.values() if account.status == status]
+        return list(self._iter_accounts("WHERE status = ?", (status.value,)))
     
     def get_accounts_by_verification_status(self, verification_status: VerificationStatus) -> List[GmailAccount]:
         """Get all accounts with specific verification status"""
-        return [account for account in self.accounts.values() if account.verification_status == verification_status]
+        return list(self._iter_accounts("WHERE verification_status = ?", (verification_status.value,)))
     
     def create_account_from_profile(self, user_profile: UserProfile, **kwargs) -> GmailAccount:
         """Create GmailAccount from UserProfile"""
-        account_id = str(uuid.uuid4())
+        account_id = uuid.uuid4().hex
+        now = datetime.now()
         
         account = GmailAccount(
             id=account_id,
@@ -315,8 +566,8 @@ class AccountManager:
             gender=user_profile.gender,
             status=AccountStatus.PENDING,
             verification_status=VerificationStatus.NOT_REQUIRED,
-            created_at=datetime.now(),
-            last_updated=datetime.now(),
+            created_at=now,
+            last_updated=now,
             country=user_profile.country,
             city=user_profile.city,
             locale=user_profile.locale,
@@ -328,11 +579,12 @@ class AccountManager:
     
     def start_batch(self, total_accounts: int, notes: str = None) -> str:
         """Start a new batch processing session"""
-        batch_id = str(uuid.uuid4())
+        batch_id = uuid.uuid4().hex
         self.current_batch_id = batch_id
+        start_time = datetime.now().isoformat()
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self.conn
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -340,28 +592,26 @@ class AccountManager:
                 VALUES (?, ?, ?, ?, ?, ?)
             """, (
                 batch_id,
-                datetime.now().isoformat(),
+                start_time,
                 total_accounts,
                 "running",
-                json.dumps(self.config_manager.get_config_summary()),
+                _json_dumps(self.config_manager.get_config_summary()).decode('utf-8'),
                 notes
             ))
             
             conn.commit()
-            conn.close()
             
             # Save batch state to file
             batch_state = {
                 "batch_id": batch_id,
-                "start_time": datetime.now().isoformat(),
+                "start_time": start_time,
                 "total_accounts": total_accounts,
                 "completed_accounts": 0,
                 "failed_accounts": 0,
                 "status": "running"
             }
             
-            with open(self.batch_state_file, 'w') as f:
-                json.dump(batch_state, f, indent=2)
+            self._write_batch_state(batch_state)
             
             logger.info(f"Started batch {batch_id} for {total_accounts} accounts")
             return batch_id
@@ -376,19 +626,30 @@ class AccountManager:
             return
         
         try:
-            # Update batch state file
-            if self.batch_state_file.exists():
-                with open(self.batch_state_file, 'r') as f:
-                    batch_state = json.load(f)
-                
-                batch_state.update({
-                    "completed_accounts": successful_count,
-                    "failed_accounts": failed_count,
-                    "last_updated": datetime.now().isoformat()
-                })
-                
-                with open(self.batch_state_file, 'w') as f:
-                    json.dump(batch_state, f, indent=2)
+            # Counters always go to the batch log row, which is cheap under WAL
+            conn = self.conn
+            conn.execute(
+                "UPDATE batch_logs SET successful_accounts = ?, failed_accounts = ? WHERE batch_id = ?",
+                (successful_count, failed_count, self.current_batch_id)
+            )
+            conn.commit()
+            
+            # In-memory state is always current; only the file write is debounced
+            batch_state = self._read_batch_state()
+            if batch_state is None:
+                return
+            batch_state.update({
+                "completed_accounts": successful_count,
+                "failed_accounts": failed_count,
+                "last_updated": datetime.now().isoformat()
+            })
+            
+            processed = successful_count + failed_count
+            if (time.monotonic() - self._last_flush_ts < BATCH_STATE_FLUSH_INTERVAL
+                    and processed % BATCH_STATE_FLUSH_EVERY):
+                return
+            
+            self._write_batch_state(batch_state)
             
         except Exception as e:
             logger.error(f"Failed to update batch progress: {e}")
@@ -398,8 +659,10 @@ class AccountManager:
         if not self.current_batch_id:
             return
         
+        end_time = datetime.now().isoformat()
+        
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self.conn
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -407,7 +670,7 @@ class AccountManager:
                 SET end_time = ?, successful_accounts = ?, failed_accounts = ?, status = ?, notes = ?
                 WHERE batch_id = ?
             """, (
-                datetime.now().isoformat(),
+                end_time,
                 successful_count,
                 failed_count,
                 "completed",
@@ -416,22 +679,18 @@ class AccountManager:
             ))
             
             conn.commit()
-            conn.close()
             
             # Update batch state file
-            if self.batch_state_file.exists():
-                with open(self.batch_state_file, 'r') as f:
-                    batch_state = json.load(f)
-                
+            batch_state = self._read_batch_state()
+            if batch_state is not None:
                 batch_state.update({
-                    "end_time": datetime.now().isoformat(),
+                    "end_time": end_time,
                     "completed_accounts": successful_count,
                     "failed_accounts": failed_count,
                     "status": "completed"
                 })
                 
-                with open(self.batch_state_file, 'w') as f:
-                    json.dump(batch_state, f, indent=2)
+                self._write_batch_state(batch_state)
             
             logger.info(f"Finished batch {self.current_batch_id}: {successful_count} successful, {failed_count} failed")
             self.current_batch_id = None
@@ -439,33 +698,88 @@ class AccountManager:
         except Exception as e:
             logger.error(f"Failed to finish batch: {e}")
     
+    def _write_batch_state(self, batch_state: Dict[str, Any]):
+        """Atomically persist batch state, keeping the previous checkpoint as a backup"""
+        tmp_file = self.batch_state_file.with_name(self.batch_state_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(batch_state, indent=True))
+        
+        if self.batch_state_file.exists():
+            os.replace(self.batch_state_file, self.batch_state_backup)
+        os.replace(tmp_file, self.batch_state_file)
+        
+        self._batch_state = batch_state
+        self._last_flush_ts = time.monotonic()
+    
+    def _read_batch_state(self) -> Optional[Dict[str, Any]]:
+        """Get the latest batch state, falling back to the backup checkpoint"""
+        if self._batch_state is not None:
+            return self._batch_state
+        
+        for state_file in (self.batch_state_file, self.batch_state_backup):
+            if not state_file.exists():
+                continue
+            try:
+                with open(state_file, 'rb') as f:
+                    self._batch_state = _json_loads(f.read())
+                return self._batch_state
+            except (OSError, ValueError) as e:
+                logger.warning(f"Unreadable batch state {state_file}: {e}")
+        
+        return None
+    
     def can_resume_batch(self) -> bool:
         """Check if there's a batch that can be resumed"""
-        if not self.batch_state_file.exists():
-            return False
-        
         try:
-            with open(self.batch_state_file, 'r') as f:
-                batch_state = json.load(f)
+            batch_state = self._read_batch_state()
+            if not batch_state or batch_state.get('status') != 'running':
+                return False
+            
+            checkpoint = batch_state.get('last_updated') or batch_state['start_time']
+            if datetime.now() - datetime.fromisoformat(checkpoint) > BATCH_STATE_MAX_AGE:
+                logger.info(f"Batch {batch_state.get('batch_id')} is stale, not resuming")
+                self._abandon_batch(batch_state)
+                return False
             
-            return batch_state.get('status') == 'running'
+            return True
             
         except Exception as e:
             logger.error(f"Failed to check batch resume status: {e}")
             return False
     
+    def _abandon_batch(self, batch_state: Dict[str, Any]):
+        """Mark a running batch that will never be resumed as abandoned"""
+        end_time = datetime.now().isoformat()
+        
+        conn = self.conn
+        conn.execute(
+            "UPDATE batch_logs SET end_time = ?, status = ? WHERE batch_id = ? AND status = ?",
+            (end_time, "abandoned", batch_state.get('batch_id'), "running")
+        )
+        conn.commit()
+        
+        batch_state.update({
+            "end_time": end_time,
+            "status": "abandoned"
+        })
+        self._write_batch_state(batch_state)
+    
     def get_batch_resume_info(self) -> Optional[Dict[str, Any]]:
         """Get information about batch that can be resumed"""
         if not self.can_resume_batch():
             return None
         
-        try:
-            with open(self.batch_state_file, 'r') as f:
-                return json.load(f)
-                
-        except Exception as e:
-            logger.error(f"Failed to get batch resume info: {e}")
-            return None
+        batch_info = dict(self._batch_state)
+        
+        # The batch log row is updated on every progress call, the state file only periodically
+        row = self.conn.execute(
+            "SELECT successful_accounts, failed_accounts FROM batch_logs WHERE batch_id = ?",
+            (batch_info['batch_id'],)
+        ).fetchone()
+        if row is not None:
+            batch_info['completed_accounts'], batch_info['failed_accounts'] = row
+        
+        return batch_info
     
     def resume_batch(self) -> Optional[str]:
         """Resume interrupted batch"""
@@ -480,31 +794,42 @@ class AccountManager:
     def export_accounts(self, file_path: str, format_type: str = "json", status_filter: AccountStatus = None) -> bool:
         """Export accounts to file"""
         try:
-            accounts_to_export = list(self.accounts.values())
-            
             if status_filter:
-                accounts_to_export = [acc for acc in accounts_to_export if acc.status == status_filter]
+                accounts_to_export = self._iter_accounts("WHERE status = ?", (status_filter.value,))
+            else:
+                accounts_to_export = self._iter_accounts()
             
+            # Records are streamed from the database and serialized one at a time
+            exported = 0
             if format_type.lower() == "json":
-                data = [account.to_dict() for account in accounts_to_export]
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                with open(file_path, 'wb') as f:
+                    f.write(b"[")
+                    for account in accounts_to_export:
+                        f.write(b",\n  " if exported else b"\n  ")
+                        f.write(_json_dumps(account.to_dict()))
+                        exported += 1
+                    f.write(b"\n]\n" if exported else b"]\n")
             
             elif format_type.lower() == "csv":
-                if accounts_to_export:
+                first = next(accounts_to_export, None)
+                if first is not None:
                     with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=accounts_to_export[0].to_dict().keys())
+                        writer = csv.DictWriter(f, fieldnames=ACCOUNT_COLUMNS)
                         writer.writeheader()
+                        writer.writerow(first.to_dict())
+                        exported = 1
                         for account in accounts_to_export:
                             writer.writerow(account.to_dict())
+                            exported += 1
             
             elif format_type.lower() == "txt":
                 with open(file_path, 'w', encoding='utf-8') as f:
                     for account in accounts_to_export:
+                        exported += 1
                         if account.status == AccountStatus.CREATED:
                             f.write(f"{account.email}:{account.password}\n")
             
-            logger.info(f"Exported {len(accounts_to_export)} accounts to {file_path}")
+            logger.info(f"Exported {exported} accounts to {file_path}")
             return True
             
         except Exception as e:
@@ -513,17 +838,20 @@ class AccountManager:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get account statistics"""
-        total = len(self.accounts)
-        status_counts = {}
-        verification_counts = {}
+        status_counts = {status.value: 0 for status in AccountStatus}
+        verification_counts = {status.value: 0 for status in VerificationStatus}
         
-        for status in AccountStatus:
-            status_counts[status.value] = len(self.get_accounts_by_status(status))
+        # Single aggregate pass in SQLite over both status columns
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT status, verification_status, COUNT(*) FROM accounts
+            GROUP BY status, verification_status
+        """)
+        for status, verification_status, count in cursor:
+            status_counts[status] = status_counts.get(status, 0) + count
+            verification_counts[verification_status] = verification_counts.get(verification_status, 0) + count
         
-        for verification_status in VerificationStatus:
-            verification_counts[verification_status.value] = len(
-                self.get_accounts_by_verification_status(verification_status)
-            )
+        total = sum(status_counts.values())
         
         # Calculate success rate
         created_count = status_counts.get(AccountStatus.CREATED.value, 0)
@@ -543,22 +871,30 @@ class AccountManager:
         try:
             cutoff_date = datetime.now() - timedelta(days=days_old)
             
-            conn = sqlite3.connect(self.db_path)
+            conn = self.conn
             cursor = conn.cursor()
             
             cursor.execute("""
                 DELETE FROM batch_logs 
-                WHERE start_time < ? AND status = 'completed'
+                WHERE start_time < ? AND status IN ('completed', 'abandoned')
             """, (cutoff_date.isoformat(),))
             
             deleted_count = cursor.rowcount
             conn.commit()
-            conn.close()
             
             logger.info(f"Cleaned up {deleted_count} old batch logs")
             
         except Exception as e:
             logger.error(f"Failed to cleanup old batches: {e}")
+    
+    def close(self):
+        """Close the database connection"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
 
 
 # Example usage
@@ -5,44 +5,52 @@ This module handles all configuration settings, logging setup,
 and environment management.
 """
 
+import atexit
+import copy
+import functools
+import importlib.util
 import json
 import logging
 import logging.handlers
 import os
+import queue
+import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict, field
-from enum import Enum
-
-# Optional imports
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-    yaml = None
-
-try:
-    import colorlog
-    COLORLOG_AVAILABLE = True
-except ImportError:
-    COLORLOG_AVAILABLE = False
-    colorlog = None
-
-try:
-    from rich.logging import RichHandler
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    RichHandler = None
-
-
-class LogLevel(Enum):
-    DEBUG = "DEBUG"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from enum import Enum, IntEnum
+
+from . import _filecache
+
+# Optional dependencies are detected here but only imported where they are used
+YAML_AVAILABLE = _filecache.YAML_AVAILABLE
+FASTJSONSCHEMA_AVAILABLE = importlib.util.find_spec("fastjsonschema") is not None
+COLORLOG_AVAILABLE = importlib.util.find_spec("colorlog") is not None
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class LogLevel(IntEnum):
+    """Log levels carrying their numeric logging value; files store the name"""
+    DEBUG = logging.DEBUG
+    INFO = logging.INFO
+    WARNING = logging.WARNING
+    ERROR = logging.ERROR
+    CRITICAL = logging.CRITICAL
+    
+    @classmethod
+    def parse(cls, value: Any) -> "LogLevel":
+        """Accept a level name such as "INFO" or a number such as 20"""
+        if isinstance(value, str):
+            try:
+                return cls[value.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown log level: {value}") from None
+        return cls(value)
 
 
 class BrowserType(Enum):
@@ -51,7 +59,7 @@ class BrowserType(Enum):
     WEBKIT = "webkit"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProxyConfig:
     """Proxy configuration settings"""
     enabled: bool = True
@@ -65,7 +73,22 @@ class ProxyConfig:
     preferred_countries: List[str] = field(default_factory=list)
 
 
-@dataclass
+# Browser launch flags are never mutated in place, so every config shares these tuples
+_DEFAULT_DISABLE_FEATURES = (
+    "VizDisplayCompositor",
+    "TranslateUI",
+    "BlinkGenPropertyTrees",
+)
+_DEFAULT_ADDITIONAL_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class BrowserConfig:
     """Browser configuration settings"""
     browser_type: BrowserType = BrowserType.CHROMIUM
@@ -83,21 +106,17 @@ class BrowserConfig:
     
     # Anti-detection settings
     disable_web_security: bool = True
-    disable_features: List[str] = field(default_factory=lambda: [
-        "VizDisplayCompositor",
-        "TranslateUI",
-        "BlinkGenPropertyTrees"
-    ])
-    additional_args: List[str] = field(default_factory=lambda: [
-        "--no-first-run",
-        "--no-default-browser-check",
-        "--disable-blink-features=AutomationControlled",
-        "--disable-dev-shm-usage",
-        "--no-sandbox"
-    ])
+    disable_features: tuple = _DEFAULT_DISABLE_FEATURES
+    additional_args: tuple = _DEFAULT_ADDITIONAL_ARGS
+    
+    def __post_init__(self):
+        if isinstance(self.browser_type, str):
+            self.browser_type = BrowserType(self.browser_type)
+        self.disable_features = tuple(self.disable_features)
+        self.additional_args = tuple(self.additional_args)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UserProfileConfig:
     """User profile generation settings"""
     use_real_names: bool = True
@@ -109,9 +128,14 @@ class UserProfileConfig:
     password_length: int = 16
     use_complex_passwords: bool = True
     birth_year_range: tuple = (1960, 2005)
+    
+    def __post_init__(self):
+        # Lists from JSON/YAML become tuples so ranges compare and index the same way
+        self.age_range = tuple(self.age_range)
+        self.birth_year_range = tuple(self.birth_year_range)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AccountConfig:
     """Account creation settings"""
     batch_size: int = 5
@@ -124,9 +148,13 @@ class AccountConfig:
     verify_accounts: bool = False
     phone_verification: bool = False
     recovery_email: bool = False
+    
+    def __post_init__(self):
+        self.delay_between_accounts = tuple(self.delay_between_accounts)
+        self.delay_between_actions = tuple(self.delay_between_actions)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StealthConfig:
     """Stealth and anti-detection settings"""
     randomize_fingerprints: bool = True
@@ -141,7 +169,28 @@ class StealthConfig:
     plugins_override: bool = True
 
 
-@dataclass
+# Format styles understood by logging.Formatter
+LOG_STYLES = ("%", "{", "$")
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _parse_log_style(value: Any) -> str:
+    """Accept one of the logging format styles: %, { or $"""
+    if value not in LOG_STYLES:
+        raise ValueError(f"Unknown log style: {value!r} (expected one of {', '.join(LOG_STYLES)})")
+    return value
+
+
+def _check_log_format(fmt: str, style: str) -> Optional[str]:
+    """Return why logging would reject this format/style pair, or None if it is usable"""
+    try:
+        logging.Formatter(fmt, style=style, validate=True)
+    except (TypeError, ValueError) as e:
+        return str(e)
+    return None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LoggingConfig:
     """Logging configuration"""
     level: LogLevel = LogLevel.INFO
@@ -150,13 +199,19 @@ class LoggingConfig:
     file_path: str = "logs/gmail_creator.log"
     max_file_size: int = 10  # MB
     backup_count: int = 5
-    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format: str = DEFAULT_LOG_FORMAT
+    style: str = "%"  # %, { or $ - must match the placeholders used in format
     date_format: str = "%Y-%m-%d %H:%M:%S"
     colored_console: bool = True
     rich_console: bool = True
+    
+    def __post_init__(self):
+        if not isinstance(self.level, LogLevel):
+            self.level = LogLevel.parse(self.level)
+        self.style = _parse_log_style(self.style)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GmailCreatorConfig:
     """Main configuration class"""
     proxy: ProxyConfig = field(default_factory=ProxyConfig)
@@ -167,13 +222,199 @@ class GmailCreatorConfig:
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     
     # Paths
-    project_root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    project_root: str = _PROJECT_ROOT
     output_dir: str = "output"
     logs_dir: str = "logs"
     data_dir: str = "data"
     config_dir: str = "config"
 
 
+# Converters for fields whose file representation differs from the attribute type
+_FIELD_CONVERTERS = {
+    BrowserType: BrowserType,
+    LogLevel: LogLevel.parse,
+    tuple: tuple,
+}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _build_schema(cls) -> Dict[str, Any]:
+    """Map each field of a config dataclass to a nested schema or a converter"""
+    schema = {}
+    for f in fields(cls):
+        if is_dataclass(f.type):
+            schema[f.name] = _build_schema(f.type)
+        else:
+            schema[f.name] = _FIELD_CONVERTERS.get(f.type, _identity)
+    return schema
+
+
+def _apply_updates(obj: Any, schema: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """Apply loaded values to a config dataclass; unknown or invalid values are skipped"""
+    for key, value in updates.items():
+        spec = schema.get(key)
+        if spec is None:
+            continue
+        if isinstance(spec, dict):
+            if isinstance(value, dict):
+                _apply_updates(getattr(obj, key), spec, value)
+            continue
+        try:
+            setattr(obj, key, spec(value))
+        except (TypeError, ValueError):
+            continue
+
+
+# Built once at import so loading a config is a plain dict walk
+_CONFIG_SCHEMA = _build_schema(GmailCreatorConfig)
+# style is a plain str field but only takes three values
+_CONFIG_SCHEMA["logging"]["style"] = _parse_log_style
+
+# JSON Schema for the serialized config, compiled by fastjsonschema when installed
+SCHEMA_FILE = os.path.join(_PROJECT_ROOT, "config", "schema.json")
+
+
+def _to_dict(obj: Any) -> Any:
+    """Convert a config dataclass to plain JSON-compatible types.
+    
+    Unlike dataclasses.asdict this does not deep-copy: lists are shared
+    with the config, tuples become lists and enums become their values
+    (log levels become their names).
+    """
+    if is_dataclass(obj):
+        return {f.name: _to_dict(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, LogLevel):
+        return obj.name
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, tuple):
+        return list(obj)
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def _get_schema_validator():
+    """Compile the config JSON Schema once; None if unavailable"""
+    if not FASTJSONSCHEMA_AVAILABLE or not os.path.exists(SCHEMA_FILE):
+        return None
+    with open(SCHEMA_FILE, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    
+    import fastjsonschema
+    return fastjsonschema.compile(schema)
+
+
+@functools.lru_cache(maxsize=128)
+def _path_exists(path: str) -> bool:
+    """Cached os.path.exists for paths checked on every validation"""
+    return os.path.exists(path)
+
+
+# Log handlers reused across setup_logging calls, keyed by the settings that shape them
+_HANDLER_CACHE: Dict[tuple, logging.Handler] = {}
+
+# Background listeners that own the real file handlers, keyed by their QueueHandler
+_QUEUE_LISTENERS: Dict[logging.Handler, logging.handlers.QueueListener] = {}
+
+# Fingerprint of the logging settings currently applied to the (process-wide) root logger
+_applied_logging_fingerprint: Optional[tuple] = None
+
+
+def _cached_handler(key: tuple, factory: Callable[[], logging.Handler]) -> logging.Handler:
+    """Return the cached handler for key, building it on first use"""
+    handler = _HANDLER_CACHE.get(key)
+    if handler is None:
+        handler = _HANDLER_CACHE[key] = factory()
+    return handler
+
+
+# colorlog's color placeholder in each logging format style
+_LOG_COLOR_PREFIX = {"%": "%(log_color)s", "{": "{log_color}", "$": "${log_color}"}
+
+
+def _create_console_handler(log_config: LoggingConfig) -> logging.Handler:
+    """Build the console handler and its formatter"""
+    if log_config.rich_console and RICH_AVAILABLE:
+        from rich.logging import RichHandler
+        handler = RichHandler(rich_tracebacks=True)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+    
+    if log_config.colored_console and COLORLOG_AVAILABLE:
+        import colorlog
+        formatter = colorlog.ColoredFormatter(
+            _LOG_COLOR_PREFIX[log_config.style] + log_config.format,
+            datefmt=log_config.date_format,
+            style=log_config.style,
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        )
+    else:
+        formatter = logging.Formatter(log_config.format, datefmt=log_config.date_format, style=log_config.style)
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    return handler
+
+
+def _create_file_handler(log_config: LoggingConfig, log_file: Path) -> logging.Handler:
+    """Build the rotating file handler behind a queue so logging never blocks on disk I/O"""
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=log_config.max_file_size * 1024 * 1024,
+        backupCount=log_config.backup_count,
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(logging.Formatter(log_config.format, datefmt=log_config.date_format, style=log_config.style))
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    
+    if not _QUEUE_LISTENERS:
+        atexit.register(_stop_queue_listeners)
+    handler = logging.handlers.QueueHandler(log_queue)
+    _QUEUE_LISTENERS[handler] = listener
+    return handler
+
+
+def _stop_queue_listeners() -> None:
+    """Flush queued records to disk and close the file handlers behind them"""
+    global _applied_logging_fingerprint
+    _applied_logging_fingerprint = None
+    
+    root_logger = logging.getLogger()
+    for key, handler in list(_HANDLER_CACHE.items()):
+        listener = _QUEUE_LISTENERS.pop(handler, None)
+        if listener is None:
+            continue
+        listener.stop()
+        for file_handler in listener.handlers:
+            file_handler.close()
+        root_logger.removeHandler(handler)
+        del _HANDLER_CACHE[key]
+
+
+# Directories this process has already created or verified
+_ensured_dirs: Set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process; repeat calls are a set lookup"""
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
 class ConfigManager:
     """Configuration manager for loading, saving, and validating settings"""
     
@@ -191,14 +432,8 @@ class ConfigManager:
             return self.config
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                if config_path.endswith('.json'):
-                    data = json.load(f)
-                else:  # YAML
-                    if YAML_AVAILABLE:
-                        data = yaml.safe_load(f) or {}
-                    else:
-                        raise ImportError("YAML support not available - please install pyyaml or use JSON config")
+            # Parsed data is shared process-wide; copy before applying
+            data = copy.deepcopy(_filecache.get_parsed(config_path))
             
             # Update config with loaded data
             self._update_config_from_dict(data)
@@ -217,22 +452,32 @@ class ConfigManager:
         """Save current configuration to file"""
         config_path = config_file or self.config_file
         
-        # Ensure config directory exists
-        os.makedirs(os.path.dirname(config_path), exist_ok=True)
-        
         try:
-            config_dict = asdict(self.config)
+            # Plain values (enum values, lists) so the file loads back with safe loaders
+            config_dict = _to_dict(self.config)
+            
+            # Open first and create the config directory only if it is missing
+            try:
+                f = open(config_path, 'w', encoding='utf-8')
+            except FileNotFoundError:
+                Path(config_path).parent.mkdir(parents=True, exist_ok=True)
+                f = open(config_path, 'w', encoding='utf-8')
             
-            with open(config_path, 'w', encoding='utf-8') as f:
+            with f:
                 if config_path.endswith('.json'):
                     json.dump(config_dict, f, indent=2, default=str)
                 else:  # YAML
                     if YAML_AVAILABLE:
-                        yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+                        yaml = _filecache.yaml_module()
+                        # Prefer the libyaml-backed dumper when PyYAML was built with it
+                        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                        yaml.dump(config_dict, f, Dumper=dumper, default_flow_style=False, indent=2)
                     else:
                         # Fallback to JSON if YAML not available
                         json.dump(config_dict, f, indent=2, default=str)
             
+            _filecache.invalidate(config_path)
+            
             if self.logger:
                 self.logger.info(f"Configuration saved to {config_path}")
                 
@@ -242,112 +487,69 @@ class ConfigManager:
     
     def _update_config_from_dict(self, data: Dict[str, Any]) -> None:
         """Update configuration from dictionary"""
-        def update_dataclass(obj, updates):
-            for key, value in updates.items():
-                if hasattr(obj, key):
-                    attr = getattr(obj, key)
-                    # Check if this is a nested dataclass by checking the field annotation
-                    if hasattr(obj, '__dataclass_fields__') and key in obj.__dataclass_fields__:
-                        field = obj.__dataclass_fields__[key]
-                        if hasattr(field.type, '__dataclass_fields__'):
-                            # Nested dataclass
-                            if isinstance(value, dict):
-                                update_dataclass(attr, value)
-                        else:
-                            # Simple attribute
-                            if key in ['browser_type'] and isinstance(value, str):
-                                # Handle enum conversion
-                                try:
-                                    setattr(obj, key, BrowserType(value))
-                                except ValueError:
-                                    continue
-                            elif key in ['level'] and isinstance(value, str):
-                                try:
-                                    setattr(obj, key, LogLevel(value))
-                                except ValueError:
-                                    continue
-                            else:
-                                setattr(obj, key, value)
-                    elif hasattr(attr, '__dict__'):
-                        # Object with dict
-                        for sub_key, sub_value in value.items():
-                            if hasattr(attr, sub_key):
-                                setattr(attr, sub_key, sub_value)
-                    else:
-                        # Simple attribute - fallback
-                        setattr(obj, key, value)
-        
-        update_dataclass(self.config, data)
+        _apply_updates(self.config, _CONFIG_SCHEMA, data)
     
     def setup_logging(self) -> logging.Logger:
         """Setup logging based on configuration"""
-        # Create logs directory
-        logs_dir = os.path.join(self.config.project_root, self.config.logs_dir)
-        os.makedirs(logs_dir, exist_ok=True)
+        global _applied_logging_fingerprint
         
-        # Configure root logger
-        root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, self.config.logging.level.value))
+        # A format that does not match its style would make every handler fail to build
+        log_config = self.config.logging
+        format_error = _check_log_format(log_config.format, log_config.style)
+        if format_error:
+            log_config = replace(log_config, format=DEFAULT_LOG_FORMAT, style="%")
         
-        # Clear existing handlers
-        root_logger.handlers.clear()
+        # Skip the rebuild when the root logger already runs with these settings
+        fingerprint = (
+            self.config.project_root, self.config.logs_dir, log_config.level,
+            log_config.console_enabled, log_config.file_enabled, log_config.file_path,
+            log_config.max_file_size, log_config.backup_count, log_config.format,
+            log_config.style, log_config.date_format, log_config.colored_console,
+            log_config.rich_console,
+        )
+        if fingerprint == _applied_logging_fingerprint and self.logger is not None:
+            return self.logger
         
-        # Create formatters
-        if self.config.logging.colored_console and COLORLOG_AVAILABLE:
-            console_formatter = colorlog.ColoredFormatter(
-                '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt=self.config.logging.date_format,
-                log_colors={
-                    'DEBUG': 'cyan',
-                    'INFO': 'green',
-                    'WARNING': 'yellow',
-                    'ERROR': 'red',
-                    'CRITICAL': 'red,bg_white',
-                }
-            )
-        else:
-            console_formatter = logging.Formatter(
-                self.config.logging.format,
-                datefmt=self.config.logging.date_format
-            )
+        # Create logs directory
+        logs_dir = Path(self.config.project_root, self.config.logs_dir)
+        _ensure_dir(logs_dir)
         
-        file_formatter = logging.Formatter(
-            self.config.logging.format,
-            datefmt=self.config.logging.date_format
-        )
+        level = int(log_config.level)
         
-        # Console handler
-        if self.config.logging.console_enabled:
-            if self.config.logging.rich_console and RICH_AVAILABLE:
-                from rich.logging import RichHandler
-                console_handler = RichHandler(rich_tracebacks=True)
-                console_handler.setFormatter(logging.Formatter("%(message)s"))
-            else:
-                console_handler = logging.StreamHandler()
-                console_handler.setFormatter(console_formatter)
-            
-            console_handler.setLevel(getattr(logging, self.config.logging.level.value))
-            root_logger.addHandler(console_handler)
+        # Handlers are shared across calls and managers with the same settings
+        handlers = []
+        if log_config.console_enabled:
+            key = ("console", log_config.colored_console, log_config.rich_console,
+                   log_config.format, log_config.style, log_config.date_format)
+            handlers.append(_cached_handler(key, lambda: _create_console_handler(log_config)))
+        
+        if log_config.file_enabled:
+            log_file = logs_dir / Path(log_config.file_path).name
+            key = ("file", log_file, log_config.max_file_size, log_config.backup_count,
+                   log_config.format, log_config.style, log_config.date_format)
+            handlers.append(_cached_handler(key, lambda: _create_file_handler(log_config, log_file)))
         
-        # File handler
-        if self.config.logging.file_enabled:
-            log_file = os.path.join(logs_dir, os.path.basename(self.config.logging.file_path))
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_file,
-                maxBytes=self.config.logging.max_file_size * 1024 * 1024,
-                backupCount=self.config.logging.backup_count,
-                encoding='utf-8'
-            )
-            file_handler.setFormatter(file_formatter)
-            file_handler.setLevel(getattr(logging, self.config.logging.level.value))
-            root_logger.addHandler(file_handler)
+        # Configure root logger, replacing any existing handlers
+        root_logger = logging.getLogger()
+        root_logger.setLevel(level)
+        root_logger.handlers.clear()
+        for handler in handlers:
+            handler.setLevel(level)
+            root_logger.addHandler(handler)
         
         # Create main logger
         self.logger = logging.getLogger('gmail_creator')
         self.logger.info("Logging system initialized")
+        if format_error:
+            self.logger.warning(f"Invalid log format, using the default format: {format_error}")
+        _applied_logging_fingerprint = fingerprint
         
         return self.logger
     
+    def shutdown(self) -> None:
+        """Flush pending file log records and release the log files"""
+        _stop_queue_listeners()
+    
     def create_directories(self) -> None:
         """Create necessary project directories"""
         directories = [
@@ -357,35 +559,65 @@ class ConfigManager:
             self.config.config_dir
         ]
         
+        root = Path(self.config.project_root)
         for directory in directories:
-            dir_path = os.path.join(self.config.project_root, directory)
-            os.makedirs(dir_path, exist_ok=True)
-            
+            _ensure_dir(root / directory)
+        
         if self.logger:
             self.logger.info("Project directories created/verified")
     
-    def validate_config(self) -> List[str]:
-        """Validate configuration and return list of errors"""
+    @staticmethod
+    def invalidate_path_cache() -> None:
+        """Forget cached file existence checks, e.g. after files were added"""
+        _path_exists.cache_clear()
+    
+    def validate_and_summarize(self) -> Tuple[List[str], Dict[str, Any]]:
+        """Validate configuration and return the errors with the config summary"""
+        proxy = self.config.proxy
+        user_profile = self.config.user_profile
+        account = self.config.account
         errors = []
         
         # Validate proxy settings
-        if self.config.proxy.enabled:
-            if not self.config.proxy.auto_fetch_free and not self.config.proxy.proxy_file and not self.config.proxy.proxy_list:
+        if proxy.enabled:
+            if not proxy.auto_fetch_free and not proxy.proxy_file and not proxy.proxy_list:
                 errors.append("Proxy enabled but no proxy source configured")
         
         # Validate paths
-        if self.config.user_profile.name_database_file:
-            if not os.path.exists(self.config.user_profile.name_database_file):
-                errors.append(f"Name database file not found: {self.config.user_profile.name_database_file}")
+        if user_profile.name_database_file:
+            if not _path_exists(user_profile.name_database_file):
+                errors.append(f"Name database file not found: {user_profile.name_database_file}")
         
-        # Validate batch size
-        if self.config.account.batch_size <= 0:
-            errors.append("Batch size must be greater than 0")
+        # Types, enum values and ranges come from the JSON Schema when available
+        validator = _get_schema_validator()
+        if validator is not None:
+            from fastjsonschema import JsonSchemaException
+            try:
+                validator(_to_dict(self.config))
+            except JsonSchemaException as e:
+                errors.append(f"Invalid configuration: {e.message}")
+        else:
+            if account.batch_size <= 0:
+                errors.append("Batch size must be greater than 0")
+            if self.config.logging.style not in LOG_STYLES:
+                errors.append(f"Invalid log style: {self.config.logging.style!r}")
         
         # Validate age range
-        if self.config.user_profile.age_range[0] >= self.config.user_profile.age_range[1]:
+        if user_profile.age_range[0] >= user_profile.age_range[1]:
             errors.append("Invalid age range")
         
+        # The format placeholders must match the configured style
+        log_config = self.config.logging
+        if log_config.style in LOG_STYLES:
+            format_error = _check_log_format(log_config.format, log_config.style)
+            if format_error:
+                errors.append(f"Invalid log format: {format_error}")
+        
+        return errors, self.get_config_summary()
+    
+    def validate_config(self) -> List[str]:
+        """Validate configuration and return list of errors"""
+        errors, _ = self.validate_and_summarize()
         return errors
     
     def get_config_summary(self) -> Dict[str, Any]:
@@ -396,7 +628,7 @@ class ConfigManager:
             "headless_mode": self.config.browser.headless,
             "batch_size": self.config.account.batch_size,
             "stealth_enabled": self.config.stealth.stealth_plugin_enabled,
-            "logging_level": self.config.logging.level.value,
+            "logging_level": self.config.logging.level.name,
             "output_format": self.config.account.output_format
         }
 
@@ -471,6 +703,7 @@ if __name__ == "__main__":
     minimal, advanced = create_example_configs()
     
     os.makedirs("config", exist_ok=True)
+    yaml = _filecache.yaml_module()
     with open("config/minimal_config.yaml", "w") as f:
         yaml.dump(minimal, f, indent=2)
     
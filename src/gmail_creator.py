@@ -126,7 +126,7 @@ class GmailCreator:
         # Browser launch options
         launch_options = {
             "headless": self.config.browser.headless,
-            "args": self.config.browser.additional_args.copy()
+            "args": list(self.config.browser.additional_args)
         }
         
         # Add proxy if available
@@ -1107,6 +1107,10 @@ class GmailCreator:
                 
                 # Create account
                 result = await self.create_single_account(user_profile, proxy)
+                if result.get('status') == 'created':
+                    # Hand the profile actually used back to callers; kept off
+                    # created_accounts so the saved account files stay serializable
+                    result = {**result, "profile": user_profile}
                 results.append(result)
                 
                 # Save progress